@@ -1,6 +1,138 @@
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from math import ceil, log2
+from random import Random
+from typing import Callable, Any
 from main import kth_merge_sort, kth_partition, kth_mm, selection_equality
 
+### FUZZING HELPERS
+SELECTORS: dict[str, Callable[..., tuple[int, float]]] = {
+    "kth_merge_sort": kth_merge_sort,
+    "kth_partition": kth_partition,
+    "kth_mm": kth_mm,
+}
+
+SHAPES: list[str] = [
+    "random", "few_distinct", "sorted", "reversed", "all_equal", "organ_pipe"
+]
+
+class CountedInt(int):
+    """
+    An integer that counts every rich comparison (`<`, `<=`, `>`, `>=`, `==`,
+    `!=`) made against it on one shared counter. This counts the work done by
+    an algorithm independently of the machine it runs on, whichever operators
+    the algorithm happens to use.
+    """
+
+    comparisons: int = 0
+
+    # Defining __eq__ would otherwise remove the inherited hash
+    __hash__ = int.__hash__
+
+    def __lt__(self, other: Any) -> bool:
+        CountedInt.comparisons += 1
+        return int.__lt__(self, other)
+
+    def __le__(self, other: Any) -> bool:
+        CountedInt.comparisons += 1
+        return int.__le__(self, other)
+
+    def __gt__(self, other: Any) -> bool:
+        CountedInt.comparisons += 1
+        return int.__gt__(self, other)
+
+    def __ge__(self, other: Any) -> bool:
+        CountedInt.comparisons += 1
+        return int.__ge__(self, other)
+
+    def __eq__(self, other: Any) -> bool:
+        CountedInt.comparisons += 1
+        return int.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        CountedInt.comparisons += 1
+        return int.__ne__(self, other)
+
+def generate_input(shape: str, size: int, rng: Random) -> list[int]:
+    """
+    Generates an input list of the given shape and size
+
+    Parameters
+    ----------
+    shape: str
+        One of "random", "few_distinct", "sorted", "reversed", "all_equal",
+        or "organ_pipe". All but "random" are adversarial to a naive
+        quick-select
+    size: int
+        The length of list to generate
+    rng: Random
+        The seeded random number generator to draw values from
+
+    Returns
+    -------
+    list[int]:
+        The generated list
+    """
+    if shape == "random":
+        return [rng.randint(-10**9, 10**9) for _ in range(size)]
+    if shape == "few_distinct":
+        return [rng.randint(0, 1) for _ in range(size)]
+    if shape == "sorted":
+        return sorted(rng.randint(-size, size) for _ in range(size))
+    if shape == "reversed":
+        return sorted(
+            (rng.randint(-size, size) for _ in range(size)), reverse=True
+        )
+    if shape == "all_equal":
+        return [rng.randint(-size, size)] * size
+    if shape == "organ_pipe":
+        return [i for i in range(size // 2)] + \
+            [i for i in range(size - size // 2, 0, -1)]
+
+    raise ValueError(f"Unknown input shape: {shape}")
+
+def merge_sort_budget(size: int) -> int:
+    """
+    The maximum number of comparisons merge sort may make for a list of the
+    given size, n * ceil(log2(n))
+
+    Parameters
+    ----------
+    size: int
+        The length of the list being sorted
+
+    Returns
+    -------
+    int:
+        The comparison budget
+    """
+    return size * max(1, ceil(log2(size)))
+
+def run_selector(
+            selector: Callable[..., tuple[int, float]], n: list[int], k: int
+        ) -> int:
+    """
+    Runs a selector on a copy of the given list without printing its
+    descriptor string
+
+    Parameters
+    ----------
+    selector: Callable[..., tuple[int, float]]
+        The (decorated) selector to run
+    n: list[int]
+        The list to find the kth smallest element for. Not modified
+    k: int
+        The target smallest element to find (1-indexed)
+
+    Returns
+    -------
+    int:
+        The selected element
+    """
+    with redirect_stdout(StringIO()):
+        return selector([i for i in n], k)[0]
+
 class SelectionTester(unittest.TestCase):
 
     def check_case(
@@ -125,5 +257,175 @@ class SelectionTester(unittest.TestCase):
 
         self.check_case(n, k, expected)
 
+class FuzzTester(unittest.TestCase):
+    """
+    Differential fuzzing: every selector is checked against `sorted` for
+    seeded random and adversarial inputs across many sizes and ranks.
+    """
+
+    SEEDS: range = range(10)
+    # Sizes around the median_of_medians base case (r * r = 25) are included
+    # on purpose. Adversarial shapes make quick-select recurse once per
+    # element, so they are kept below the default recursion limit
+    SIZES: list[int] = [1, 2, 3, 4, 5, 10, 24, 25, 26, 49, 50, 51, 125, 300]
+    RANDOM_SIZES: list[int] = [1_000, 5_000]
+    def check_all_ranks(self, n: list[int], rng: Random) -> None:
+        """
+        Checks every selector against `sorted` for the edge ranks (first,
+        second, middle, second-to-last, last) and a few random ranks
+
+        Parameters
+        ----------
+        n: list[int]
+            The input list to pass to all the selection methods
+        rng: Random
+            The seeded random number generator to draw ranks from
+        """
+        expected = sorted(n)
+        ranks = {1, 2, (len(n) + 1) // 2, len(n) - 1, len(n)}
+        ranks |= {rng.randint(1, len(n)) for _ in range(3)}
+
+        for k in sorted(k for k in ranks if 1 <= k <= len(n)):
+            for name, selector in SELECTORS.items():
+                with self.subTest(size=len(n), k=k, selector=name):
+                    self.assertEqual(
+                        run_selector(selector, n, k), expected[k - 1]
+                    )
+
+    def test_shapes(self) -> None:
+        for seed in self.SEEDS:
+            rng = Random(seed)
+            for shape in SHAPES:
+                for size in self.SIZES:
+                    with self.subTest(seed=seed, shape=shape):
+                        self.check_all_ranks(
+                            generate_input(shape, size, rng), rng
+                        )
+
+    def test_large_random(self) -> None:
+        for seed in self.SEEDS:
+            rng = Random(seed)
+            for size in self.RANDOM_SIZES:
+                with self.subTest(seed=seed):
+                    self.check_all_ranks(
+                        generate_input("random", size, rng), rng
+                    )
+
+class BudgetTester(unittest.TestCase):
+    """
+    Performance budgets: each selector may make at most a fixed number of
+    comparisons for a given input size. Comparison counts do not depend on
+    the machine, so a selector that becomes asymptotically slower fails here
+    instead of only showing up in `comparison.png`.
+
+    `KNOWN_QUADRATIC` lists the known quadratic behaviour of `partition` (it
+    always pivots on the last element, and sends duplicates of the pivot to
+    the same side). Those cases must still select correctly, and must still
+    be over budget; once one is fixed it fails here, at which point it should
+    be removed from the table.
+    """
+
+    SEED: int = 3310
+    LARGE_SIZE: int = 100_000
+    ADVERSARIAL_SIZE: int = 300
+
+    # Comparisons allowed per element for the linear selectors
+    PARTITION_BUDGET: int = 8
+    MM_BUDGET: int = 12
+
+    # (selector, shape) pairs known to exceed their budget
+    KNOWN_QUADRATIC: set[tuple[str, str]] = {
+        ("kth_partition", "few_distinct"),
+        ("kth_partition", "sorted"),
+        ("kth_partition", "reversed"),
+        ("kth_partition", "all_equal"),
+        ("kth_partition", "organ_pipe"),
+        ("kth_mm", "few_distinct"),
+        ("kth_mm", "all_equal"),
+    }
+
+    def budget(self, name: str, size: int) -> int:
+        """
+        Finds the comparison budget of a selector
+
+        Parameters
+        ----------
+        name: str
+            The name of the selector (a key of `SELECTORS`)
+        size: int
+            The length of the input list
+
+        Returns
+        -------
+        int:
+            The maximum number of comparisons allowed for a single selection
+        """
+        if name == "kth_partition":
+            return self.PARTITION_BUDGET * size
+        if name == "kth_mm":
+            return self.MM_BUDGET * size
+
+        return merge_sort_budget(size)
+
+    def check_budget(self, name: str, shape: str, size: int) -> None:
+        """
+        Checks that the selector selects correctly and stays within its
+        comparison budget for the first, middle, and last ranks of a
+        generated input. Known quadratic cases are instead checked to still
+        exceed their budget at one of those ranks
+
+        Parameters
+        ----------
+        name: str
+            The name of the selector to check (a key of `SELECTORS`)
+        shape: str
+            The shape of input to generate (see `generate_input`)
+        size: int
+            The length of list to generate
+        """
+        rng = Random(self.SEED)
+        n = [CountedInt(i) for i in generate_input(shape, size, rng)]
+        expected = sorted(n)
+        budget = self.budget(name, size)
+
+        worst_k, worst = 0, 0
+        for k in (1, (size + 1) // 2, size):
+            CountedInt.comparisons = 0
+            chosen = run_selector(SELECTORS[name], n, k)
+            comparisons = CountedInt.comparisons
+
+            # Correctness is never excused, even for known quadratic cases
+            self.assertEqual(chosen, expected[k - 1])
+            # Guards against the elements being unwrapped to plain integers
+            if size > 1:
+                self.assertGreater(comparisons, 0)
+
+            if comparisons > worst:
+                worst_k, worst = k, comparisons
+
+        message = (
+            f"{name} on {shape} input of size {size:_}, k={worst_k:_}: " +
+            f"{worst:_} comparisons (budget {budget:_})"
+        )
+        if (name, shape) in self.KNOWN_QUADRATIC:
+            self.assertGreater(
+                worst, budget,
+                message + " is now within budget; remove it from " +
+                "KNOWN_QUADRATIC"
+            )
+        else:
+            self.assertLessEqual(worst, budget, message)
+
+    def test_large_random(self) -> None:
+        for name in SELECTORS:
+            with self.subTest(selector=name):
+                self.check_budget(name, "random", self.LARGE_SIZE)
+
+    def test_adversarial(self) -> None:
+        for name in SELECTORS:
+            for shape in SHAPES:
+                with self.subTest(selector=name, shape=shape):
+                    self.check_budget(name, shape, self.ADVERSARIAL_SIZE)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file